@@ -1,9 +1,18 @@
+import io
+import sys
+from functools import lru_cache
 from pathlib import Path
-from itertools import chain
-from typing import Any, Literal
+from typing import Callable, Literal, TextIO
 
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
 
 OutputType = Literal['series', 'str', 'stdout', 'print']
 
@@ -63,11 +72,14 @@ class KeyExtractor:
         if to not in ('series', 'str', 'stdout', 'print'):
             raise ValueError("Output type must be one of: 'series', 'str', 'stdout', 'print'")
 
+        groupby_list = self._get_grouper(groupby)
+        batch_list = self._get_grouper(batch_name) if batch_size else []
+
         if isinstance(self, KeyExtractorSeries):
             processed_data = self._preprocess(
                 unique=unique,
                 sample=sample,
-                groupby=groupby,
+                groupby=groupby_list,
                 batch_size=batch_size,
                 batch_name=batch_name,
             )
@@ -76,21 +88,20 @@ class KeyExtractor:
                 key=key,
                 unique=unique,
                 sample=sample,
-                groupby=groupby,
+                groupby=groupby_list,
                 batch_size=batch_size,
                 batch_name=batch_name,
             )
 
-        return self._output_data(processed_data, to, sep, groupby, batch_name, batch_size)
+        return self._output_data(processed_data, to, sep, groupby_list, batch_list)
 
     def _output_data(
         self,
         data: pd.Series,
         output_type: OutputType,
         sep: str,
-        groupby: list[str]|str|None,
-        batch_name: str,
-        batch_size: int|None,
+        groupby_list: list[str],
+        batch_list: list[str],
     ) -> pd.Series|str|None:
         """
         Route data to appropriate output format.
@@ -103,30 +114,25 @@ class KeyExtractor:
             Desired output format
         sep : str
             Separator for string output
-        groupby : list[str] | str | None
+        groupby_list : list[str]
             Grouping columns
-        batch_name : str
-            Name for batch groups
-        batch_size : int | None
-            Size of batches
+        batch_list : list[str]
+            Batch level name, empty if not batched
 
         Returns
         -------
         pd.Series | str | None
             Data in requested format
         """
-        collected_groups = self._collect_groups(
-            self._get_grouper(groupby),
-            self._get_grouper(batch_name if batch_size else None)
-        )
+        collected_groups = self._collect_groups(groupby_list, batch_list)
 
         if output_type == 'series':
             return data
         elif output_type == 'str':
             return self._stringify(data, collected_groups, sep=sep)
         elif output_type in ('stdout', 'print'):
-            output = self._stringify(data, collected_groups, sep=sep)
-            print(output)
+            self._stream_output(data, sys.stdout, collected_groups, sep=sep)
+            sys.stdout.write('\n')
             return None
 
     def _collect_groups(self, *args: list[str]) -> list[str]:
@@ -143,15 +149,17 @@ class KeyExtractor:
         list[str]
             Combined list of group names
         """
-        return list(chain.from_iterable(args))
+        if len(args) == 2:
+            return [*args[0], *args[1]]
+        return [name for arg in args for name in arg]
 
-    def _get_grouper(self, groupby: Any) -> list[str]:
+    def _get_grouper(self, groupby: list[str]|str|None) -> list[str]:
         """
         Convert groupby parameter to list format.
 
         Parameters
         ----------
-        groupby : Any
+        groupby : list[str] | str | None
             Grouping specification
 
         Returns
@@ -161,16 +169,17 @@ class KeyExtractor:
         """
         if groupby is None:
             return []
-        if pd.api.types.is_scalar(groupby):
-            return [groupby]
-        return list(groupby)
+        if isinstance(groupby, (list, tuple)):
+            return list(groupby)
+        # any other hashable is a single label, e.g. an integer column name
+        return [groupby]
 
     def _preprocess(
         self,
         key: str|None = None,
         unique: bool = True,
         sample: int|None = None,
-        groupby: list[str]|str|None = None,
+        groupby: list[str]|None = None,
         batch_size: int|None = None,
         batch_name: str = 'batch',
     ) -> pd.Series:
@@ -185,8 +194,8 @@ class KeyExtractor:
             If True, ensures keys are unique within groups
         sample : int | None, optional
             Number of random samples to take
-        groupby : list[str] | str | None, optional
-            Columns to group by
+        groupby : list[str] | None, optional
+            Columns to group by, as resolved by _get_grouper
         batch_size : int | None, optional
             Size of batches to create
         batch_name : str, default 'batch'
@@ -197,62 +206,168 @@ class KeyExtractor:
         pd.Series
             Processed data
         """
-        cols = [*self._get_grouper(groupby)]
+        groupby = groupby or []
+        cols = [*groupby]
         if hasattr(self, 'key'):
             cols.append(self.key)
         elif key:
             cols.append(key)
 
-        data = self._obj.reset_index().filter(cols)
+        if isinstance(self._obj, pd.Series):
+            obj = self._obj.to_frame()
+        else:
+            obj = self._obj
 
+        # only move the index into the columns if a requested column lives there
+        needs_reset = any(c not in obj.columns for c in cols)
+        if needs_reset:
+            data = self._obj.reset_index()[cols]
+        else:
+            data = obj[cols].reset_index(drop=True)
+
+        # the key is always the last selected column
+        values = data.iloc[:, -1]
+        groups = [data.iloc[:, i] for i in range(len(groupby))]
+
+        # hash object keys once, so deduplication and batching group on integer codes;
+        # arrow-backed strings are left alone, arrow groups them without python objects
+        restore = [i for i, group in enumerate(groups) if group.dtype == object]
+        if restore:
+            groups = [
+                group.astype('category') if i in restore else group
+                for i, group in enumerate(groups)
+            ]
+            data = pd.concat([*groups, values], axis=1, ignore_index=True)
+
+        # collect the surviving row positions first and gather everything once
         if unique:
-            data = data.drop_duplicates(subset=cols)
+            positions = self._first_positions(data)
+        else:
+            positions = np.arange(len(data))
 
-        if groupby:
-            data = data.set_index(self._get_grouper(groupby), append=True)
+        result = self._assemble(
+            values,
+            groups,
+            positions,
+            groupby=groupby,
+            sample=sample,
+            batch_size=batch_size,
+            batch_name=batch_name,
+        )
+
+        if restore:
+            # only the levels need converting back, the codes are unaffected
+            index = result.index
+            result.index = index.set_levels(
+                [index.levels[i + 1].astype(object) for i in restore],
+                level=[i + 1 for i in restore],
+            )
+        return result
+
+    def _assemble(
+        self,
+        values: pd.Series,
+        groups: list[pd.Series],
+        positions: np.ndarray,
+        groupby: list[str],
+        sample: int|None = None,
+        batch_size: int|None = None,
+        batch_name: str = 'batch',
+    ) -> pd.Series:
+        """
+        Gather the rows at the given positions into the output series.
+
+        Parameters
+        ----------
+        values : pd.Series
+            Key values
+        groups : list[pd.Series]
+            Group key columns, aligned with values
+        positions : np.ndarray
+            Row positions to keep
+        groupby : list[str]
+            Names of the group key columns
+        sample : int | None, optional
+            Number of random samples to take
+        batch_size : int | None, optional
+            Size of batches to create
+        batch_name : str, default 'batch'
+            Name for batch groups
+
+        Returns
+        -------
+        pd.Series
+            Key values indexed by position, groups and batch
+        """
+        groups = [group.array.take(positions) for group in groups]
+        levels = [positions, *groups]
+        names = [None, *groupby]
 
         if batch_size:
-            data = self._add_batches(data, batch_size, batch_name, groupby)
+            levels.append(self._add_batches(groups, positions.size, batch_size))
+            names.append(batch_name)
 
         if sample:
-            data = data.sample(n=sample)
+            rng = np.random.default_rng()
+            picked = rng.choice(positions.size, size=sample, replace=False)
+            levels = [level.take(picked) for level in levels]
+
+        data = values.array.take(levels[0])
+        if len(levels) > 1:
+            index = pd.MultiIndex.from_arrays(levels, names=names)
+        else:
+            index = pd.Index(levels[0])
+        return pd.Series(data, index=index, name=values.name, dtype=values.dtype)
 
-        return data.squeeze()
+    def _first_positions(self, data: pd.DataFrame|pd.Series) -> np.ndarray:
+        """
+        Find the position of the first occurrence of each distinct row.
+
+        Parameters
+        ----------
+        data : pd.DataFrame | pd.Series
+            Rows to deduplicate
+
+        Returns
+        -------
+        np.ndarray
+            Sorted positions of the rows to keep
+        """
+        return np.flatnonzero(~data.duplicated(keep='first').to_numpy())
 
     def _add_batches(
         self,
-        data: pd.Series,
+        groups: list[pd.api.extensions.ExtensionArray],
+        n: int,
         batch_size: int,
-        batch_name: str,
-        groupby: list[str]|str|None,
-    ) -> pd.Series:
+    ) -> np.ndarray:
         """
-        Add batch numbers to the index.
+        Compute batch numbers, counted within groups if any.
 
         Parameters
         ----------
-        data : pd.Series
-            Data to batch
+        groups : list[ExtensionArray]
+            Group key arrays, one per grouping column
+        n : int
+            Number of rows to batch
         batch_size : int
             Size of each batch
-        batch_name : str
-            Name for batch groups
-        groupby : list[str] | str | None
-            Grouping columns
 
         Returns
         -------
-        pd.Series
-            Data with batch numbers in index
+        np.ndarray
+            Batch number for each row, starting at 1
         """
-        def get_batch_numbers(n: int) -> pd.RangeIndex:
-            return (pd.RangeIndex(n) // batch_size + 1).rename(batch_name)
-
-        if groupby:
-            return data.groupby(groupby, group_keys=False).apply(
-                lambda x: x.set_index(get_batch_numbers(len(x)), append=True)
+        if groups:
+            # group by frame columns, a bare list of n arrays would be read as one key
+            keys = pd.DataFrame(dict(enumerate(groups)))
+            grouped = keys.groupby(
+                list(range(len(groups))), sort=False, dropna=False, observed=True
             )
-        return data.set_index(get_batch_numbers(len(data)), append=True)
+            position = grouped.cumcount().to_numpy()
+        else:
+            position = np.arange(n)
+        return position // batch_size + 1
 
     def _stringify(
         self,
@@ -277,24 +392,206 @@ class KeyExtractor:
         str
             String representation of data
         """
-        def format_group(group_series: pd.Series, group_name: str = '') -> str:
-            return (
-                f"[{group_name}] ({len(group_series)})\n"
-                f"{sep.join(map(str, group_series))}\n\n"
+        buffer = io.StringIO()
+        self._stream_output(s, buffer, groupby, sep=sep)
+        return buffer.getvalue()
+
+    def _stream_output(
+        self,
+        s: pd.Series,
+        sink: TextIO,
+        groupby: list[str]|None = None,
+        sep: str = ';'
+    ) -> None:
+        """
+        Write the string representation of a series to a text stream.
+
+        Parameters
+        ----------
+        s : pd.Series
+            Series to convert
+        sink : TextIO
+            Stream to write to
+        groupby : list[str] | None, optional
+            Grouping columns
+        sep : str, default ';'
+            Separator for values
+        """
+        stringifier = self._make_stringifier(tuple(groupby or ()), sep)
+        stringifier(s, sink)
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _make_stringifier(
+        groupby: tuple[str, ...],
+        sep: str,
+    ) -> Callable[[pd.Series, TextIO], None]:
+        """
+        Build a writer specialized for the given grouping and separator.
+
+        Parameters
+        ----------
+        groupby : tuple[str, ...]
+            Grouping columns, empty if not grouped
+        sep : str
+            Separator for values
+
+        Returns
+        -------
+        Callable[[pd.Series, TextIO], None]
+            Function writing a series to a text stream
+        """
+        to_strings = KeyExtractor._to_strings
+        join_chunks = KeyExtractor._join_chunks
+        group_chunks = KeyExtractor._group_chunks
+        levels = list(groupby)
+
+        if not levels:
+            def write(s: pd.Series, sink: TextIO) -> None:
+                if len(s):
+                    sink.write(join_chunks(s, np.array([len(s)]), sep)[0])
+            return write
+
+        if len(levels) == 1:
+            prefix = f"[{levels[0]}: "
+
+            def write(s: pd.Series, sink: TextIO) -> None:
+                keys, counts, joined = group_chunks(s, levels, sep)
+                headers = pd.Series(to_strings(keys.iloc[:, 0]), dtype=object)
+                sink.writelines(
+                    prefix + headers + '] (' + to_strings(counts) + ')\n' + joined + '\n\n'
+                )
+            return write
+
+        prefixes = [f"{level}: " for level in levels]
+
+        def write(s: pd.Series, sink: TextIO) -> None:
+            keys, counts, joined = group_chunks(s, levels, sep)
+            labels = [
+                prefix + pd.Series(to_strings(keys.iloc[:, i]), dtype=object)
+                for i, prefix in enumerate(prefixes)
+            ]
+            headers = labels[0].str.cat(labels[1:], sep=' | ')
+            sink.writelines(
+                '[' + headers + '] (' + to_strings(counts) + ')\n' + joined + '\n\n'
             )
+        return write
 
-        if not groupby:
-            return sep.join(map(str, s))
+    @staticmethod
+    def _group_chunks(
+        s: pd.Series,
+        groupby: list[str],
+        sep: str,
+    ) -> tuple[pd.DataFrame, pd.Series, np.ndarray]:
+        """
+        Join the values of each group into a single string.
+
+        Parameters
+        ----------
+        s : pd.Series
+            Series to convert
+        groupby : list[str]
+            Grouping columns
+        sep : str
+            Separator for values
 
-        output = []
-        for name, group in s.groupby(groupby):
-            if isinstance(name, tuple):
-                group_name = ' | '.join(f"{level}: {val}" for level, val in zip(groupby, name))
-            else:
-                group_name = f"{groupby[0]}: {name}"
-            output.append(format_group(group, group_name))
+        Returns
+        -------
+        tuple[pd.DataFrame, pd.Series, np.ndarray]
+            Group keys, group sizes and joined values, one row per group
+        """
+        grouped = s.groupby(groupby, sort=False)
+        counts = grouped.size()
+        # rows in dropped (NA) groups sort last and end up past the final group
+        order = np.argsort(grouped.ngroup().to_numpy(), kind='stable')
+        joined = KeyExtractor._join_chunks(s, counts.to_numpy(), sep, order=order)
+        return counts.index.to_frame(index=False), counts, joined
+
+    @staticmethod
+    def _join_chunks(
+        s: pd.Series,
+        sizes: np.ndarray,
+        sep: str,
+        order: np.ndarray|None = None,
+    ) -> np.ndarray:
+        """
+        Join consecutive runs of values into one string per run.
 
-        return ''.join(output)
+        Parameters
+        ----------
+        s : pd.Series
+            Series to convert
+        sizes : np.ndarray
+            Length of each run
+        sep : str
+            Separator for values
+        order : np.ndarray | None, optional
+            Positions to reorder the values by before splitting into runs
+
+        Returns
+        -------
+        np.ndarray
+            Joined string for each run
+        """
+        offsets = np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64)
+
+        # arrow-backed strings are joined by arrow without boxing into python objects
+        if pa is not None and KeyExtractor._is_arrow_string(s.dtype):
+            values = pa.array(s.array)
+            if isinstance(values, pa.ChunkedArray):
+                values = values.combine_chunks()
+            values = pc.fill_null(values, str(s.dtype.na_value))
+            if order is not None:
+                values = values.take(order)
+            runs = pa.LargeListArray.from_arrays(offsets, values)
+            joined = pc.binary_join(runs, pa.scalar(sep, type=values.type))
+            return joined.to_numpy(zero_copy_only=False)
+
+        # convert once, then slice each run out of the converted array
+        strings = KeyExtractor._to_strings(s)
+        if order is not None:
+            strings = strings[order]
+        chunks = np.split(strings, offsets[1:])[:-1]
+        return np.array([sep.join(chunk.tolist()) for chunk in chunks], dtype=object)
+
+    @staticmethod
+    def _is_arrow_string(dtype: object) -> bool:
+        """
+        Check whether a dtype holds strings in pyarrow storage.
+
+        Parameters
+        ----------
+        dtype : object
+            Dtype to check
+
+        Returns
+        -------
+        bool
+            True for pyarrow-backed string dtypes
+        """
+        if isinstance(dtype, pd.StringDtype):
+            return dtype.storage == 'pyarrow'
+        if isinstance(dtype, pd.ArrowDtype):
+            return pa.types.is_string(dtype.pyarrow_dtype) or pa.types.is_large_string(dtype.pyarrow_dtype)
+        return False
+
+    @staticmethod
+    def _to_strings(s: pd.Series) -> np.ndarray:
+        """
+        Convert series values to strings in a single pass.
+
+        Parameters
+        ----------
+        s : pd.Series
+            Series to convert
+
+        Returns
+        -------
+        np.ndarray
+            Object array with the string representation of each value
+        """
+        # keep object dtype, a fixed-width unicode array is sized by the longest value
+        return np.fromiter(map(str, s), dtype=object, count=len(s))
 
     def to_file(
         self,
@@ -328,29 +625,31 @@ class KeyExtractor:
             Name for batch groups
         """
         path = Path(path)
+        groupby_list = self._get_grouper(groupby)
+        batch_list = self._get_grouper(batch_name) if batch_size else []
+
         processed_data = self._preprocess(
             key=key,
             unique=unique,
             sample=sample,
-            groupby=groupby,
+            groupby=groupby_list,
             batch_size=batch_size,
             batch_name=batch_name,
         )
 
-        collected_groups = self._collect_groups(
-            self._get_grouper(groupby),
-            self._get_grouper(batch_name if batch_size else None)
-        )
+        collected_groups = self._collect_groups(groupby_list, batch_list)
         ymd = pd.Timestamp.today().strftime('%Y%m%d')
+        template = f"{ymd}.{{key}}.{{n}}.txt"
         if collected_groups:
-            for group, data in processed_data.groupby(collected_groups):
+            groups = processed_data.groupby(collected_groups, sort=False).indices
+            for group, positions in groups.items():
                 key_parts = group if isinstance(group, tuple) else [group]
                 key_str = '_'.join(map(str, key_parts))
-                filename = f"{ymd}.{key_str}.{len(data)}.txt"
-                data.to_csv(path / filename, index=False)
+                filename = template.format(key=key_str, n=positions.size)
+                processed_data.iloc[positions].to_csv(path / filename, index=False)
         else:
             current_key = getattr(self, 'key', key)
-            filename = f"{ymd}.{current_key}.{len(processed_data)}.txt"
+            filename = template.format(key=current_key, n=len(processed_data))
             processed_data.to_csv(path / filename, index=False)
 
 
@@ -374,3 +673,60 @@ class KeyExtractorSeries(KeyExtractor):
             Name of the series
         """
         return self._obj.name
+
+    def _preprocess(
+        self,
+        key: str|None = None,
+        unique: bool = True,
+        sample: int|None = None,
+        groupby: list[str]|None = None,
+        batch_size: int|None = None,
+        batch_name: str = 'batch',
+    ) -> pd.Series:
+        """
+        Preprocess the series, without a DataFrame round trip when ungrouped.
+
+        Parameters
+        ----------
+        key : str | None, optional
+            Ignored, the series name is used as key
+        unique : bool, default True
+            If True, ensures keys are unique within groups
+        sample : int | None, optional
+            Number of random samples to take
+        groupby : list[str] | None, optional
+            Index levels to group by, as resolved by _get_grouper
+        batch_size : int | None, optional
+            Size of batches to create
+        batch_name : str, default 'batch'
+            Name for batch groups
+
+        Returns
+        -------
+        pd.Series
+            Processed data
+        """
+        if groupby:
+            return super()._preprocess(
+                key=key,
+                unique=unique,
+                sample=sample,
+                groupby=groupby,
+                batch_size=batch_size,
+                batch_name=batch_name,
+            )
+
+        if unique:
+            positions = self._first_positions(self._obj)
+        else:
+            positions = np.arange(len(self._obj))
+
+        return self._assemble(
+            self._obj,
+            [],
+            positions,
+            groupby=[],
+            sample=sample,
+            batch_size=batch_size,
+            batch_name=batch_name,
+        )
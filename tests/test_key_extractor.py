@@ -11,6 +11,11 @@ import io
 import sys
 from contextlib import contextmanager
 
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
 @contextmanager
 def capture_stdout():
     """Capture stdout for testing print output."""
@@ -107,11 +112,100 @@ class TestKeyExtractor(unittest.TestCase):
             """).lstrip()
         self.assertEqual(result, expected)
 
+    def test_df_groupby_with_batching(self):
+        """Test batch creation within groups in DataFrame."""
+        df = pd.DataFrame({
+            'category': ['A', 'B', 'A', 'B', 'A'],
+            'value': [1, 2, 3, 4, 5]
+        })
+        result = df.askeys('value', groupby='category', batch_size=2, to='str')
+        expected = dedent("""
+            [category: A | batch: 1] (2)
+            1;3
+
+            [category: B | batch: 1] (2)
+            2;4
+
+            [category: A | batch: 2] (1)
+            5
+
+            """).lstrip()
+        self.assertEqual(result, expected)
+
+    def test_df_groupby_multiple_with_batching(self):
+        """Test batching with as many surviving rows as group columns."""
+        df = pd.DataFrame({'a': ['y', 'y'], 'b': [1, 2], 'v': [4, 4]})
+        result = df.askeys('v', groupby=['a', 'b'], batch_size=1, to='str')
+        expected = dedent("""
+            [a: y | b: 1 | batch: 1] (1)
+            4
+
+            [a: y | b: 2 | batch: 1] (1)
+            4
+
+            """).lstrip()
+        self.assertEqual(result, expected)
+
+    def test_df_sample(self):
+        """Test that sampled rows keep their values, groups and batches aligned."""
+        df = pd.DataFrame({
+            'category': ['A', 'B', 'A', 'B', 'A', 'B', 'A', 'B'] * 2,
+            'value': [1, 2, 3, 4, 5, 6, 7, 8] * 2,
+        })
+        for groupby, batch_size in [(None, None), ('category', None), ('category', 2), (None, 3)]:
+            with self.subTest(groupby=groupby, batch_size=batch_size):
+                full = df.askeys(
+                    'value', groupby=groupby, batch_size=batch_size, to='series'
+                )
+                result = df.askeys(
+                    'value', groupby=groupby, batch_size=batch_size, sample=5, to='series'
+                )
+                self.assertEqual(len(result), 5)
+                positions = result.index.get_level_values(0)
+                self.assertTrue(positions.is_unique)
+                self.assertTrue(positions.isin(full.index.get_level_values(0)).all())
+                # every sampled row, labels included, is a row of the unsampled result
+                pd.testing.assert_series_equal(result, full.loc[result.index])
+
+    def test_df_groupby_keeps_dtype(self):
+        """Test that object group keys keep their dtype in the index."""
+        df = self.df.astype({'category': object})
+        result = df.askeys('value', groupby='category', to='series')
+        self.assertEqual(result.index.get_level_values('category').dtype, object)
+        self.assertEqual(list(result.index.get_level_values('category')), list(df['category']))
+
+    def test_df_groupby_integer_labels(self):
+        """Test grouping by a non-string column label in DataFrame."""
+        df = self.df.set_axis([0, 1, 2], axis=1)
+        result = df.askeys(2, groupby=0, to='str')
+        expected = self.df.askeys('value', groupby='category', to='str')
+        self.assertEqual(result, expected.replace('category', '0'))
+
     def test_series_basic_extraction(self):
         """Test basic key extraction from Series."""
         result = self.series.askeys(to='series')
         pd.testing.assert_series_equal(result, self.series)
 
+    def test_df_groupby_index_level(self):
+        """Test grouping by an index level in DataFrame."""
+        df = self.df.set_index('category')
+        result = df.askeys('value', groupby='category', to='str')
+        expected = self.df.askeys('value', groupby='category', to='str')
+        self.assertEqual(result, expected)
+
+    def test_series_unique_mixed_types(self):
+        """Test that values with the same text but different types stay distinct."""
+        series = pd.Series([1, '1', 2.0, '2.0', 1], dtype=object, name='mixed')
+        result = series.askeys(to='str')
+        self.assertEqual(result, '1;1;2.0;2.0')
+
+    def test_series_keeps_object_dtype(self):
+        """Test that object values are not re-inferred as another dtype."""
+        series = pd.Series(['x', None, pd.NA], dtype=object, name='mixed')
+        result = series.askeys(unique=False, to='series')
+        self.assertEqual(result.dtype, object)
+        self.assertEqual(series.askeys(unique=False, to='str'), 'x;None;<NA>')
+
     def test_series_batching(self):
         """Test batch creation in Series."""
         result = self.series.askeys(batch_size=2, to='str')
@@ -193,6 +287,27 @@ class TestKeyExtractor(unittest.TestCase):
         result = df.askeys('value', to='str')
         self.assertIn('string', result)
 
+    @unittest.skipIf(pa is None, "pyarrow is not installed")
+    def test_arrow_strings_match_object(self):
+        """Test that arrow-backed strings render like object strings."""
+        df = pd.DataFrame({
+            'category': ['A', 'B', 'A', None, 'B'],
+            'value': ['x', None, 'z', 'w', 'v'],
+        })
+        dtypes = [
+            pd.StringDtype('pyarrow'),
+            pd.ArrowDtype(pa.string()),
+            pd.ArrowDtype(pa.large_string()),
+        ]
+        for dtype in dtypes:
+            arrow_df = df.astype({'value': dtype})
+            object_df = arrow_df.astype({'value': object})
+            for groupby in (None, 'category'):
+                with self.subTest(dtype=str(dtype), groupby=groupby):
+                    result = arrow_df.askeys('value', groupby=groupby, unique=False, to='str')
+                    expected = object_df.askeys('value', groupby=groupby, unique=False, to='str')
+                    self.assertEqual(result, expected)
+
     def test_different_separators(self):
         """Test different separator characters."""
         separators = [';', '|', ',']